@@ -1,5 +1,10 @@
+from __future__ import annotations
+
 import os
+from array import array
+from dataclasses import dataclass, field
 from pathlib import Path
+import heapq
 import json
 import subprocess
 
@@ -12,8 +17,21 @@ DATA_DIR = ROOT / "data"
 SNAPSHOT_PATH = DATA_DIR / "levels_latest.json"
 
 
+def _levels_by_name(data):
+    """Byg dict: name -> level ud fra liste af {name, level}.
+
+    Entries uden name eller level springes over.
+    """
+    return {
+        name: int(level)
+        for item in data
+        if (name := item.get("name")) is not None
+        and (level := item.get("level")) is not None
+    }
+
+
 def fetch_levels():
-    """Kør Rust-programmet og få liste af {name, level}."""
+    """Kør Rust-programmet og få dict: name -> level."""
     if not RUST_BINARY.exists():
         raise FileNotFoundError(
             f"Rust-binary findes ikke: {RUST_BINARY}\n"
@@ -60,15 +78,7 @@ def fetch_levels():
             f"Output var (forkortet):\n{stdout_txt[:500]}"
         )
 
-    levels = []
-    for item in data:
-        name = item.get("name")
-        level = item.get("level")
-        if name is None or level is None:
-            continue
-        levels.append({"name": name, "level": int(level)})
-
-    return levels
+    return _levels_by_name(data)
 
 
 def load_previous_levels():
@@ -83,50 +93,60 @@ def load_previous_levels():
     with SNAPSHOT_PATH.open("r", encoding="utf-8") as f:
         data = json.load(f)
 
-    prev = {}
-    for item in data:
-        name = item.get("name")
-        level = item.get("level")
-        if name is None or level is None:
-            continue
-        prev[name] = int(level)
-
-    return prev
+    return _levels_by_name(data)
 
 
 def save_today_levels(levels):
-    """Gem dagens snapshot (overskriver det gamle)."""
+    """Gem dagens snapshot (overskriver det gamle).
+
+    Gemmes som liste af {name, level}, samme format som før.
+    """
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    snapshot = [{"name": name, "level": level} for name, level in levels.items()]
     with SNAPSHOT_PATH.open("w", encoding="utf-8") as f:
-        json.dump(levels, f, ensure_ascii=False, indent=2)
+        # Kompakt JSON – snapshot læses af scriptet, ingen grund til indent
+        json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
 
 
-def get_active_players(prev_levels, current_levels):
-    """Returnér liste over spillere, der er steget i level siden sidst.
+@dataclass(slots=True)
+class ActivePlayers:
+    """Spillere der er steget i level, gemt som parallelle arrays.
 
-    Hver entry: {name, from, to, delta}
+    Index i svarer til én spiller: names[i], froms[i], tos[i], deltas[i].
     """
+
+    names: list[str] = field(default_factory=list)
+    froms: array[int] = field(default_factory=lambda: array("i"))
+    tos: array[int] = field(default_factory=lambda: array("i"))
+    deltas: array[int] = field(default_factory=lambda: array("i"))
+
+    def __len__(self):
+        return len(self.names)
+
+    def append(self, name, lvl_from, lvl_to):
+        """Tilføj én spiller til alle fire kolonner."""
+        self.names.append(name)
+        self.froms.append(lvl_from)
+        self.tos.append(lvl_to)
+        self.deltas.append(lvl_to - lvl_from)
+
+
+def get_active_players(prev_levels, current_levels):
+    """Returnér de spillere, der er steget i level siden sidst."""
+    active = ActivePlayers()
+
     if prev_levels is None:
         # Første gang scriptet kører – ingen sammenligning mulig
-        return []
-
-    active = []
+        return active
 
-    for m in current_levels:
-        name = m["name"]
-        lvl_today = m["level"]
+    prev_get = prev_levels.get
 
-        lvl_prev = prev_levels.get(name)
-        if lvl_prev is None:
+    for name, lvl_today in current_levels.items():
+        lvl_prev = prev_get(name)
+        if lvl_prev is None or lvl_today <= lvl_prev:
             continue
 
-        if lvl_today > lvl_prev:
-            active.append({
-                "name": name,
-                "from": lvl_prev,
-                "to": lvl_today,
-                "delta": lvl_today - lvl_prev,
-            })
+        active.append(name, lvl_prev, lvl_today)
 
     return active
 
@@ -142,15 +162,15 @@ def main():
         print("\n=== Ingen spillere har udviklet sig siden sidst (eller første kørsel) ===")
         return
 
-    active_sorted = sorted(active_players, key=lambda x: x["delta"], reverse=True)
-    top_50 = active_sorted[:50]
+    deltas = active_players.deltas
+    top_50 = heapq.nlargest(50, range(len(active_players)), key=lambda i: deltas[i])
 
     print("\n=== Top 50 mest udviklede siden i går ===")
-    for i, p in enumerate(top_50, start=1):
+    for i, idx in enumerate(top_50, start=1):
         print(
-            f"{i:2d}. {p['name']:<20} "
-            f"{p['from']:>4} → {p['to']:<4} "
-            f"(+{p['delta']})"
+            f"{i:2d}. {active_players.names[idx]:<20} "
+            f"{active_players.froms[idx]:>4} → {active_players.tos[idx]:<4} "
+            f"(+{deltas[idx]})"
         )
 
 